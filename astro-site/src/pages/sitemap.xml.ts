@@ -1,7 +1,7 @@
 import type { APIRoute } from "astro";
 import { statSync } from "node:fs";
 import meta from "../data/build_meta.json";
-import board from "../data/big_board_2026.json";
+import board from "../data/big_board_2026_index.json";
 import teamNeeds from "../data/team_needs_2026.json";
 import { teamPath } from "../lib/teamNeeds";
 